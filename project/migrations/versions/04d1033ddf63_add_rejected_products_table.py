@@ -0,0 +1,35 @@
+"""add rejected_products table
+
+Revision ID: 04d1033ddf63
+Revises: 55130b7ad79b
+Create Date: 2026-10-17 16:08:31.863937
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '04d1033ddf63'
+down_revision = '55130b7ad79b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The app's db.create_all() adds missing tables whenever it starts, so the table may exist already
+    if sa.inspect(op.get_bind()).has_table('rejected_products'):
+        return
+    op.create_table('rejected_products',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('pid', sa.String(length=50), nullable=True),
+    sa.Column('rule', sa.String(length=50), nullable=False),
+    sa.Column('message', sa.String(length=200), nullable=False),
+    sa.Column('row_data', sa.Text(), nullable=False),
+    sa.Column('rejected_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('rejected_products')
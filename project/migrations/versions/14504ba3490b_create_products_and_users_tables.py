@@ -0,0 +1,52 @@
+"""create products and users tables
+
+Revision ID: 14504ba3490b
+Revises:
+Create Date: 2026-10-17 15:20:41.207713
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '14504ba3490b'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The tables as the app first created them; the indexes, row_hash and the wider password come in later revisions.
+    # The app's db.create_all() adds missing tables whenever it starts, so they may exist already
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('users'):
+        op.create_table('users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=50), nullable=False),
+        sa.Column('password', sa.String(length=120), nullable=False),
+        sa.Column('role', sa.String(length=20), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('username')
+        )
+    if not inspector.has_table('Products'):
+        op.create_table('Products',
+        sa.Column('pid', sa.String(length=50), nullable=False),
+        sa.Column('product_name', sa.String(length=100), nullable=False),
+        sa.Column('category', sa.String(length=50), nullable=False),
+        sa.Column('price_in_dollar', sa.Float(), nullable=False),
+        sa.Column('price_in_inr', sa.Float(), nullable=True),
+        sa.Column('price_category', sa.String(length=20), nullable=True),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('return_rate', sa.Float(), nullable=False),
+        sa.Column('uid', sa.String(length=50), nullable=False),
+        sa.Column('user_name', sa.String(length=100), nullable=False),
+        sa.Column('branch', sa.String(length=100), nullable=False),
+        sa.PrimaryKeyConstraint('pid'),
+        sa.UniqueConstraint('pid')
+        )
+
+
+def downgrade():
+    op.drop_table('Products')
+    op.drop_table('users')
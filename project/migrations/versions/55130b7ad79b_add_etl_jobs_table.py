@@ -0,0 +1,39 @@
+"""add etl_jobs table
+
+Revision ID: 55130b7ad79b
+Revises: c2a6c7da39dc
+Create Date: 2026-10-17 16:08:31.863730
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '55130b7ad79b'
+down_revision = 'c2a6c7da39dc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The app's db.create_all() adds missing tables whenever it starts, so the table may exist already
+    if sa.inspect(op.get_bind()).has_table('etl_jobs'):
+        return
+    op.create_table('etl_jobs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('owner', sa.String(length=50), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('stage', sa.String(length=20), nullable=True),
+    sa.Column('params', sa.Text(), nullable=False),
+    sa.Column('rows_processed', sa.Integer(), nullable=False),
+    sa.Column('timings', sa.Text(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('etl_jobs')
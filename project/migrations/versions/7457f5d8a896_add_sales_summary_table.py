@@ -0,0 +1,37 @@
+"""add sales_summary table
+
+Revision ID: 7457f5d8a896
+Revises: 04d1033ddf63
+Create Date: 2026-10-17 16:08:31.864169
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7457f5d8a896'
+down_revision = '04d1033ddf63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The app's db.create_all() adds missing tables whenever it starts, so the table may exist already.
+    # /sales_analysis fills an empty summary from Products on first use
+    if sa.inspect(op.get_bind()).has_table('sales_summary'):
+        return
+    op.create_table('sales_summary',
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('branch', sa.String(length=100), nullable=False),
+    sa.Column('total_sales', sa.Float(), nullable=False),
+    sa.Column('product_count', sa.Integer(), nullable=False),
+    sa.Column('total_quantity', sa.Integer(), nullable=False),
+    sa.Column('top_pid', sa.String(length=50), nullable=True),
+    sa.Column('top_sales', sa.Float(), nullable=True),
+    sa.PrimaryKeyConstraint('category', 'branch')
+    )
+
+
+def downgrade():
+    op.drop_table('sales_summary')
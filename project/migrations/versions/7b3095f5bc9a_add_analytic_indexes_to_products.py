@@ -0,0 +1,33 @@
+"""add analytic indexes to products
+
+Revision ID: 7b3095f5bc9a
+Revises: 14504ba3490b
+Create Date: 2026-10-17 15:22:05.418330
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b3095f5bc9a'
+down_revision = '14504ba3490b'
+branch_labels = None
+depends_on = None
+
+indexed_columns = ['category', 'branch', 'price_category', 'uid']
+
+
+def upgrade():
+    # db.create_all() already creates these indexes on new databases, so only add the missing ones
+    existing = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('Products')}
+    with op.batch_alter_table('Products', schema=None) as batch_op:
+        for column in indexed_columns:
+            if f'ix_Products_{column}' not in existing:
+                batch_op.create_index(batch_op.f(f'ix_Products_{column}'), [column], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('Products', schema=None) as batch_op:
+        for column in reversed(indexed_columns):
+            batch_op.drop_index(batch_op.f(f'ix_Products_{column}'))
@@ -0,0 +1,29 @@
+"""add row_hash to products
+
+Revision ID: c2a6c7da39dc
+Revises: 7b3095f5bc9a
+Create Date: 2026-10-17 16:08:31.863161
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2a6c7da39dc'
+down_revision = '7b3095f5bc9a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases that db.create_all() built after the column was added were stamped at an older head, so may have it
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('Products')}
+    if 'row_hash' not in columns:
+        with op.batch_alter_table('Products', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('row_hash', sa.String(length=16), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('Products', schema=None) as batch_op:
+        batch_op.drop_column('row_hash')
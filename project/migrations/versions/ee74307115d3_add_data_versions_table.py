@@ -0,0 +1,32 @@
+"""add data_versions table
+
+Revision ID: ee74307115d3
+Revises: 7457f5d8a896
+Create Date: 2026-10-17 16:08:31.864318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ee74307115d3'
+down_revision = '7457f5d8a896'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The app's db.create_all() adds missing tables whenever it starts, so the table may exist already
+    if sa.inspect(op.get_bind()).has_table('data_versions'):
+        return
+    op.create_table('data_versions',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('data_versions')
@@ -0,0 +1,40 @@
+""" The ETL functions as they were before the rewrites, kept as a reference for the tests """
+import pandas as pd
+
+
+def legacy_getandcleandata(dataset):
+    """ The row-wise cleaning function as it was before vectorization, raising instead of returning the error """
+    dataset.dropna(inplace=True)
+    dataset.drop_duplicates(subset=['pid'], inplace=True)
+    dataset['price_in_dollar'] = pd.to_numeric(dataset['price_in_dollar'], errors='coerce')
+    dataset['quantity'] = pd.to_numeric(dataset['quantity'], errors='coerce')
+    dataset['return_rate'] = pd.to_numeric(dataset['return_rate'], errors='coerce')
+    dataset['price_in_inr'] = dataset['price_in_dollar'] * 83
+    dataset['price_category'] = dataset['price_in_inr'].apply(
+        lambda x: 'Expensive' if x > 5000 else 'Cheap')
+    dataset['quantity'] = dataset['quantity'].clip(lower=0)
+    dataset['return_rate'] = dataset['return_rate'].clip(lower=0, upper=100)
+    if not dataset['price_in_dollar'].between(0, 10000).all():
+        raise ValueError("Price in dollar is out of expected range.")
+    if not dataset['quantity'].between(0, 1000).all():
+        raise ValueError("Quantity is out of expected range.")
+    if dataset[['pid', 'price_in_dollar', 'quantity']].isnull().any().any():
+        raise ValueError("Missing critical data (pid, price_in_dollar, quantity).")
+    if dataset.duplicated(subset=['pid']).any():
+        raise ValueError("Duplicate entries found based on pid.")
+    if dataset['price_in_dollar'].max() > 10000:
+        raise ValueError("Outlier detected in price_in_dollar.")
+    if not dataset['return_rate'].between(0, 100).all():
+        raise ValueError("Return rate is out of expected range (0-100).")
+    return dataset.dropna()
+
+
+def legacy_save_products(dataset):
+    """ The ORM loader as it was before the bulk load engine """
+    from app import Products, db
+    product_records = [
+        Products(**{column: row[column] for column in Products.__table__.columns.keys() if column in dataset.columns})
+        for _, row in dataset.iterrows()
+    ]
+    db.session.bulk_save_objects(product_records)
+    db.session.commit()
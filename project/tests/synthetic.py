@@ -0,0 +1,112 @@
+""" Synthetic products for the tests, and sources for the benchmarks with a chosen fraction of dirty rows.
+Run it to write a dataset of any size to disk, in the five source formats the ETL reads:
+
+    python tests/synthetic.py --rows 1000000 --dirty 0.05 --out /tmp/products
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def make_products(rows, seed=0, dirty=0.0, start=0):
+    """ Build a synthetic products dataset with the same columns as the source files.
+    A dirty fraction of the rows gets one bad value each, of the kinds the cleaning has to deal with """
+    rng = np.random.default_rng([seed, start])
+    ids = np.arange(start, start + rows)
+    dataset = pd.DataFrame({
+        'pid': np.char.add('p', ids.astype(str)),
+        'product_name': np.char.add('product ', (ids % 1000).astype(str)),
+        'category': rng.choice(['electronics', 'sport', 'kitchen', 'footwear', 'baby products'], rows),
+        'price_in_dollar': rng.integers(1, 100, rows),
+        'quantity': rng.integers(0, 100, rows),
+        'return_rate': rng.integers(0, 10, rows),
+        'uid': np.char.add('u', ids.astype(str)),
+        'user_name': rng.choice(['kamala', 'nalini', 'kiran', 'chandani'], rows),
+        'branch': rng.choice(['kukatpally', 'nizampet', 'ameerpet', 'Secunderabad'], rows),
+    })
+    if dirty:
+        add_dirt(dataset, rng, dirty, product_dirt)
+    return dataset
+
+
+# Kinds of dirty values: the column each one spoils, and how to make the bad values for the given rows
+product_dirt = {
+    'missing_value': ('branch', lambda dataset, rows, rng: None),
+    'repeated_pid': ('pid', lambda dataset, rows, rng: dataset['pid'].to_numpy()[np.maximum(rows - 1, 0)]),
+    'price_outlier': ('price_in_dollar', lambda dataset, rows, rng: rng.integers(10001, 50000, len(rows))),
+    'negative_price': ('price_in_dollar', lambda dataset, rows, rng: -rng.integers(1, 100, len(rows))),
+    'unparseable_quantity': ('quantity', lambda dataset, rows, rng: 'n/a'),
+    'negative_quantity': ('quantity', lambda dataset, rows, rng: -rng.integers(1, 100, len(rows))),
+    'return_rate_range': ('return_rate', lambda dataset, rows, rng: rng.integers(101, 500, len(rows))),
+}
+
+
+def add_dirt(dataset, rng, fraction, kinds):
+    """ Spoil a fraction of the rows in place, each with one dirty value of a randomly chosen kind """
+    spoiled = np.flatnonzero(rng.random(len(dataset)) < fraction)
+    chosen = rng.integers(len(kinds), size=len(spoiled))
+    for kind, (column, values) in enumerate(kinds.values()):
+        rows = spoiled[chosen == kind]
+        if len(rows):
+            # Dirty columns mix types, as they do when read from the source files
+            dataset[column] = dataset[column].astype(object)
+            dataset.loc[rows, column] = values(dataset, rows, rng)
+
+
+# Source formats in the order of the ETL's source files: extension, writer, and the most rows one file may hold
+source_formats = {
+    'csv': ('.csv', lambda dataset, path: dataset.to_csv(path, index=False), None),
+    'xlsx': ('.xlsx', lambda dataset, path: dataset.to_excel(path, index=False), 1000000),
+    'json': ('.json', lambda dataset, path: dataset.to_json(path, orient='records'), None),
+    'html': ('.html', lambda dataset, path: dataset.to_html(path, index=False), None),
+    'xml': ('.lxml', lambda dataset, path: dataset.to_xml(path, index=False, parser='etree'), None),
+}
+
+
+def write_sources(make, rows, directory, seed=0, dirty=0.0, formats=tuple(source_formats)):
+    """ Write a synthetic dataset split evenly over the given formats as f1, f2, ... in that order.
+    Each file is generated on its own, so memory stays bounded whatever the size, and formats
+    with a row limit (Excel) get as many files as they need """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    start = 0
+    for fmt, share in zip(formats, np.diff(np.linspace(0, rows, len(formats) + 1).astype(int))):
+        extension, write, limit = source_formats[fmt]
+        while share > 0:
+            count = min(share, limit or share)
+            path = os.path.join(directory, f"f{len(paths) + 1}{extension}")
+            write(make(count, seed=seed, dirty=dirty, start=start), path)
+            paths.append(path)
+            start += count
+            share -= count
+    return paths
+
+
+def products(n, **changes):
+    """ Cleaned products as getandcleandata returns them """
+    return pd.DataFrame({'pid': [f"p{i}" for i in range(n)], 'product_name': 'lamp', 'category': 'home',
+                         'price_in_dollar': 2, 'price_in_inr': 166, 'price_category': 'Cheap', 'quantity': 3,
+                         'return_rate': 1, 'uid': 'u1', 'user_name': 'kiran', 'branch': 'ameerpet'}).assign(**changes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write a synthetic products dataset in the ETL\'s source formats.')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--dirty', type=float, default=0.05, help='fraction of rows with one dirty value')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--formats', nargs='+', choices=list(source_formats), default=list(source_formats))
+    parser.add_argument('--out', required=True, help='directory to write f1, f2, ... to')
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    paths = write_sources(make_products, args.rows, args.out, args.seed, args.dirty, args.formats)
+    print(f"{args.rows} product rows, {args.dirty:.0%} dirty, written in {time.perf_counter() - start:.1f}s")
+    for path in paths:
+        print(f"  {path}  {os.path.getsize(path) / 1024 ** 2:8.1f}MB")
+    return paths
+
+
+if __name__ == '__main__':
+    main()
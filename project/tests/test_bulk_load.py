@@ -0,0 +1,69 @@
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from app import Products, bulk_load, bulk_writer, db
+from synthetic import products
+
+columns = ['pid', 'product_name', 'price_in_inr']
+rows = [('p1', 'tab\there', 83.0), ('p2', None, None)]
+
+
+class RecordingCursor:
+    """ Stands in for a DB-API cursor, recording what the writer sends """
+    def __init__(self):
+        self.calls = []
+    def execute(self, sql, parameters=None):
+        self.calls.append(('execute', sql, parameters))
+    def executemany(self, sql, parameters):
+        self.calls.append(('executemany', sql, list(parameters)))
+    def copy_expert(self, sql, source):
+        self.calls.append(('copy', sql, source.read()))
+
+
+def written(dialect, upsert_key=None):
+    cursor = RecordingCursor()
+    bulk_writer(dialect, Products.__table__, columns, upsert_key)(cursor, rows)
+    return cursor.calls
+
+
+def test_postgresql_copies_the_rows_as_text():
+    [(kind, sql, data)] = written(postgresql.psycopg2.dialect())
+    assert (kind, sql) == ('copy', 'COPY "Products" (pid, product_name, price_in_inr) FROM STDIN')
+    assert data == 'p1\ttab\\there\t83.0\np2\t\\N\t\\N\n'
+
+
+def test_postgresql_upserts_through_a_temporary_table():
+    calls = written(postgresql.psycopg2.dialect(), upsert_key='pid')
+    assert [kind for kind, _, _ in calls] == ['execute', 'copy', 'execute', 'execute']
+    assert calls[1][1] == 'COPY "Products_load" (pid, product_name, price_in_inr) FROM STDIN'
+    assert calls[2][1] == ('INSERT INTO "Products" (pid, product_name, price_in_inr) SELECT pid, product_name, price_in_inr '
+                           'FROM "Products_load" ON CONFLICT (pid) DO UPDATE SET product_name = excluded.product_name, '
+                           'price_in_inr = excluded.price_in_inr')
+
+
+def test_postgresql_drivers_without_copy_use_their_paramstyle():
+    [(kind, sql, parameters)] = written(postgresql.pg8000.dialect())
+    assert kind == 'executemany' and parameters == rows
+    assert sql == 'INSERT INTO "Products" (pid, product_name, price_in_inr) VALUES (%s, %s, %s)'
+
+
+def test_mysql_sends_one_multi_row_statement():
+    [(kind, sql, parameters)] = written(mysql.mysqldb.dialect(), upsert_key='pid')
+    assert kind == 'execute'
+    assert sql == ('INSERT INTO `Products` (pid, product_name, price_in_inr) VALUES (%s, %s, %s), (%s, %s, %s)'
+                   ' ON DUPLICATE KEY UPDATE product_name = VALUES(product_name), price_in_inr = VALUES(price_in_inr)')
+    assert parameters == [value for row in rows for value in row]
+
+
+def test_sqlite_uses_executemany():
+    [(kind, sql, parameters)] = written(sqlite.pysqlite.dialect(), upsert_key='pid')
+    assert kind == 'executemany' and parameters == rows
+    assert sql.startswith('INSERT INTO "Products" (pid, product_name, price_in_inr) VALUES (?, ?, ?) ON CONFLICT (pid)')
+
+
+def test_bulk_load_inserts_and_upserts_in_batches(app, empty_products):
+    with app.app_context():
+        assert bulk_load(Products, products(5, price_in_inr=[166.0] * 4 + [None]), batch_size=2) == 5
+        assert db.session.get(Products, 'p4').price_in_inr is None
+        bulk_load(Products, products(7, quantity=9), batch_size=3, upsert_key='pid')
+        quantities = db.session.execute(db.select(Products.quantity)).scalars().all()
+    assert quantities == [9] * 7
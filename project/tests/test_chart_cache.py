@@ -0,0 +1,70 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app import cached_chart, data_version, db, rebuild_sales_summary, save_products
+from synthetic import products
+
+
+def test_every_products_write_moves_the_data_version(app, client, empty_products, monkeypatch):
+    monkeypatch.setitem(app.config, 'BULK_BATCH_SIZE', 2)
+    with app.app_context():
+        start, _ = data_version('Products')
+        # One bump per committed batch
+        save_products(products(5))
+        assert data_version('Products')[0] == start + 3
+        # Nothing new or changed, so nothing is written and the cached charts stay valid
+        save_products(products(5), incremental=True)
+        assert data_version('Products')[0] == start + 3
+        save_products(products(5, quantity=4), incremental=True)
+        assert data_version('Products')[0] == start + 6
+        rebuild_sales_summary()
+        assert data_version('Products')[0] == start + 7
+    client.post('/delete_product/p0')
+    with app.app_context():
+        version, updated_at = data_version('Products')
+    assert version == start + 8
+    assert updated_at.tzinfo is not None
+
+
+def test_concurrent_misses_on_one_chart_render_it_once():
+    calls = []
+    release = threading.Event()
+
+    def render():
+        calls.append(1)
+        release.wait(5)
+        return b'png'
+    with ThreadPoolExecutor(4) as pool:
+        results = [pool.submit(cached_chart, 'once', 1, render) for _ in range(4)]
+        release.set()
+        assert [result.result(5) for result in results] == [b'png'] * 4
+    assert len(calls) == 1
+
+
+def test_cache_hits_do_not_wait_for_a_render_in_flight():
+    cached_chart('hit', 1, lambda: b'cached')
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_render():
+        started.set()
+        release.wait(5)
+        return b'slow'
+    with ThreadPoolExecutor(1) as pool:
+        slow = pool.submit(cached_chart, 'slow', 1, slow_render)
+        assert started.wait(5)
+        try:
+            assert cached_chart('hit', 1, lambda: b'rendered again') == b'cached'
+        finally:
+            release.set()
+        assert slow.result(5) == b'slow'
+
+
+def test_a_failed_render_is_not_cached():
+    def broken():
+        raise RuntimeError('no data')
+    with pytest.raises(RuntimeError):
+        cached_chart('broken', 1, broken)
+    assert cached_chart('broken', 1, lambda: b'png') == b'png'
@@ -0,0 +1,54 @@
+import os
+
+import pandas as pd
+import pytest
+
+from app import getandcleandata
+from legacy import legacy_getandcleandata
+
+data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+def sample():
+    return pd.concat([pd.read_csv(os.path.join(data_dir, f"f{n}.csv")) for n in range(1, 6)], ignore_index=True)
+
+
+def with_rows(*rows):
+    """ The sample sources with some rows added, as the readers would give them """
+    data = sample().astype(object)
+    return pd.concat([data, pd.DataFrame([dict(zip(data.columns, row)) for row in rows])], ignore_index=True)
+
+
+good_row = ('p90', 'lamp', 'home', 12, 3, 1, 'u90', 'kiran', 'ameerpet')
+
+
+@pytest.mark.parametrize('make', [
+    sample,
+    # Missing values and repeated pids are dropped, the first row of a pid wins
+    lambda: with_rows(good_row, ('p91', 'desk', 'home', 40, 2, 0, 'u91', None, 'ameerpet'), ('p01',) + good_row[1:]),
+    # Numbers read as text, a negative quantity and a return rate over 100 are fixed up
+    lambda: with_rows(('p92', 'rug', 'home', '61', '-4', '250', 'u92', 'kiran', 'nizampet')),
+], ids=['sample', 'nulls-and-repeats', 'fixed-up'])
+def test_cleaning_matches_the_row_wise_version(app, make):
+    with app.app_context():
+        cleaned = getandcleandata(make())
+    expected = legacy_getandcleandata(make())
+    assert isinstance(cleaned, pd.DataFrame)
+    assert cleaned.index.tolist() == expected.index.tolist()
+    assert cleaned.columns.tolist() == expected.columns.tolist()
+    # The dtypes are narrower now (downcast quantity, categorical price_category), the values are the same
+    pd.testing.assert_frame_equal(cleaned.astype({'price_category': str}), expected, check_dtype=False)
+
+
+@pytest.mark.parametrize('row', [
+    ('p93', 'tv', 'electronics', 20000, 1, 0, 'u93', 'maya', 'nampally'),
+    ('p94', 'tv', 'electronics', -5, 1, 0, 'u94', 'maya', 'nampally'),
+    ('p95', 'tv', 'electronics', 300, 5000, 0, 'u95', 'maya', 'nampally'),
+    ('p96', 'tv', 'electronics', 300, 'n/a', 0, 'u96', 'maya', 'nampally'),
+], ids=['price-outlier', 'negative-price', 'quantity-range', 'unparseable-quantity'])
+def test_cleaning_fails_with_the_row_wise_message(app, row):
+    with app.app_context():
+        cleaned = getandcleandata(with_rows(row))
+    with pytest.raises(ValueError) as error:
+        legacy_getandcleandata(with_rows(row))
+    assert cleaned.get_json() == {"message": f"Error: {error.value}"}
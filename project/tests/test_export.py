@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from app import save_products
+from synthetic import products
+
+
+@pytest.fixture
+def stored(app, empty_products):
+    with app.app_context():
+        save_products(products(3))
+
+
+@pytest.mark.parametrize('export_format', ['ndjson', 'csv'])
+def test_fields_asked_for_twice_are_exported_once(client, stored, export_format):
+    response = client.get(f'/export/products?fields=pid,quantity,pid&format={export_format}')
+    assert response.status_code == 200
+    body = response.get_data(as_text=True)
+    if export_format == 'ndjson':
+        assert [json.loads(line) for line in body.splitlines()] == [{'pid': f"p{i}", 'quantity': 3} for i in range(3)]
+    else:
+        assert body.splitlines() == ['pid,quantity', 'p0,3', 'p1,3', 'p2,3']
+
+
+def test_unknown_fields_are_refused_before_streaming(client, stored):
+    response = client.get('/export/products?fields=pid,password')
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "Unknown fields: password"}
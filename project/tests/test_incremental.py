@@ -0,0 +1,22 @@
+from app import Products, db, row_hashes, save_products
+from synthetic import products
+
+
+def test_incremental_reruns_write_only_new_and_changed_rows(app, empty_products):
+    with app.app_context():
+        assert save_products(products(5)) == 5
+        assert save_products(products(5), incremental=True) == 0
+        changed = products(6)
+        changed.loc[2, 'quantity'] = 8
+        # The changed row and the new one, upserted on pid
+        assert save_products(changed, incremental=True) == 2
+        stored = dict(db.session.execute(db.select(Products.pid, Products.quantity)).all())
+    assert stored == {'p0': 3, 'p1': 3, 'p2': 8, 'p3': 3, 'p4': 3, 'p5': 3}
+
+
+def test_row_hashes_do_not_depend_on_the_dtypes_a_source_was_read_with():
+    columns = ['pid', 'product_name', 'price_in_dollar', 'quantity']
+    from_csv = products(3)[columns]
+    from_html = from_csv.astype({'price_in_dollar': 'float64', 'quantity': 'int8', 'pid': object})
+    assert row_hashes(from_csv, columns) == row_hashes(from_html, columns)
+    assert row_hashes(from_csv, columns) != row_hashes(from_csv.assign(quantity=4), columns)
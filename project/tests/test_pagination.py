@@ -0,0 +1,50 @@
+import base64
+import json
+
+import pytest
+
+from app import Products, decode_cursor, encode_cursor, keyset_page, save_products
+from synthetic import products
+
+
+def cursor_of(value):
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+
+@pytest.fixture
+def stored_products(app, empty_products):
+    with app.app_context():
+        save_products(products(7, price_in_dollar=[5, 3, 5, 1, 4, 3, 2]))
+    yield
+
+
+def test_keyset_pages_walk_every_row_once_in_order(app, stored_products):
+    seen = []
+    cursor = None
+    with app.app_context():
+        while True:
+            rows, cursor = keyset_page(Products.query, Products.pid, Products.price_in_dollar, True, cursor, 3)
+            seen += [(row.price_in_dollar, row.pid) for row in rows]
+            if cursor is None:
+                break
+    assert seen == sorted(seen, reverse=True)
+    assert len(seen) == len(set(seen)) == 7
+
+
+def test_cursors_round_trip_the_sort_position():
+    assert decode_cursor(encode_cursor([2.0, 'p4']), [Products.price_in_dollar, Products.pid]) == [2.0, 'p4']
+    # A whole number may come back as a JSON integer, which still fits a float column
+    assert decode_cursor(cursor_of([3, 'p1']), [Products.price_in_dollar, Products.pid]) == [3, 'p1']
+
+
+@pytest.mark.parametrize('after', [
+    'not base64!', cursor_of('p1')[:-2], base64.urlsafe_b64encode(b'\xff\xfe').decode(), cursor_of({'pid': 'p1'}),
+    cursor_of(['p1', 'p2']), cursor_of([{'$gt': 1}, 'p1']), cursor_of([[1], 'p1']), cursor_of(['cheap', 'p1']),
+    cursor_of([True, 'p1']), cursor_of([None, 'p1']), cursor_of([2.0, 4]),
+    base64.urlsafe_b64encode(b'[' * 5000).decode(),
+], ids=['garbage', 'truncated', 'not-utf8', 'object', 'too-long', 'dict-value', 'list-value', 'text-for-float',
+        'bool', 'null', 'number-for-text', 'deeply-nested'])
+def test_tampered_cursors_are_rejected_with_400(client, stored_products, after):
+    response = client.get('/showproductdata', query_string={'sort': 'price_in_dollar', 'after': after})
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "Invalid page cursor."}
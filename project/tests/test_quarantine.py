@@ -0,0 +1,91 @@
+import os
+
+import pandas as pd
+import pytest
+
+import app as app_module
+from app import (Products, RejectedProduct, _rejects_path, db, discard_staged, getandcleandata, load_staged,
+                 save_products, stage_dataset)
+
+
+def raw_products(n, **changes):
+    """ Raw products as read from a source, before cleaning """
+    return pd.DataFrame({'pid': [f"q{i}" for i in range(n)], 'product_name': 'lamp', 'category': 'home',
+                         'price_in_dollar': 2.0, 'quantity': 3, 'return_rate': 1.0, 'uid': 'u1',
+                         'user_name': 'kiran', 'branch': 'ameerpet'}).assign(**changes)
+
+
+@pytest.fixture
+def empty_rejects(app, empty_products):
+    with app.app_context():
+        db.session.execute(db.delete(RejectedProduct))
+        db.session.commit()
+    yield
+    with app.app_context():
+        db.session.execute(db.delete(RejectedProduct))
+        db.session.commit()
+
+
+def stored_rejects():
+    return sorted(db.session.execute(db.select(RejectedProduct.pid, RejectedProduct.rule)).all())
+
+
+def test_quarantine_mode_sets_failing_rows_aside_with_the_first_rule_they_failed():
+    data = raw_products(4)
+    data.loc[1, 'price_in_dollar'] = 20000.0
+    data.loc[3, 'quantity'] = 5000
+    rejects = []
+    cleaned = getandcleandata(data, rejects)
+    assert cleaned['pid'].tolist() == ['q0', 'q2']
+    records = pd.concat(rejects)
+    # price_range comes before price_outlier in validation_rules
+    assert records[['pid', 'rule']].values.tolist() == [['q1', 'price_range'], ['q3', 'quantity_range']]
+    assert '"pid":"q1"' in records['row_data'].iloc[0]
+
+
+def test_rejects_are_loaded_with_the_staged_dataset(app, empty_rejects):
+    data = raw_products(5, price_in_dollar=[2.0, 20000.0, 2.0, 2.0, 20000.0])
+    with app.app_context():
+        rejects = []
+        version = stage_dataset('quarantine', getandcleandata(data, rejects), rejects)
+        assert load_staged('quarantine', version) == 3
+        assert stored_rejects() == [('q1', 'price_range'), ('q4', 'price_range')]
+        assert db.session.scalar(db.select(db.func.count()).select_from(Products)) == 3
+    assert not os.path.exists(_rejects_path('quarantine', version))
+
+
+def test_rejects_roll_back_with_a_failing_batch(app, empty_rejects):
+    data = raw_products(3, price_in_dollar=[2.0, 20000.0, 2.0])
+    with app.app_context():
+        rejects = []
+        cleaned = getandcleandata(data, rejects)
+        # The stored pid makes the plain insert of the staged batch fail
+        save_products(cleaned.iloc[:1])
+        version = stage_dataset('quarantine', cleaned, rejects)
+        with pytest.raises(Exception):
+            load_staged('quarantine', version)
+        assert stored_rejects() == []
+        # Still staged, so a retry writes them with the batch
+        assert os.path.exists(_rejects_path('quarantine', version))
+        discard_staged('quarantine', version)
+
+
+def test_rejects_are_inserted_in_bulk_batch_size_statements(app, empty_rejects, monkeypatch):
+    monkeypatch.setitem(app.config, 'BULK_BATCH_SIZE', 2)
+    statements = []
+    bulk_writer = app_module.bulk_writer
+
+    def recording_writer(dialect, table, columns, upsert_key=None):
+        write = bulk_writer(dialect, table, columns, upsert_key)
+        def record(cursor, rows):
+            statements.append((table.name, len(rows)))
+            write(cursor, rows)
+        return record
+    monkeypatch.setattr(app_module, 'bulk_writer', recording_writer)
+    data = raw_products(6, price_in_dollar=[2.0] + [20000.0] * 5)
+    with app.app_context():
+        rejects = []
+        version = stage_dataset('quarantine', getandcleandata(data, rejects), rejects)
+        load_staged('quarantine', version)
+        assert len(stored_rejects()) == 5
+    assert [size for name, size in statements if name == 'rejected_products'] == [2, 2, 1]
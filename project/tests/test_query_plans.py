@@ -0,0 +1,78 @@
+import re
+from contextlib import contextmanager
+from urllib.parse import unquote
+
+import pytest
+from sqlalchemy import event
+
+from app import Products, db, indexed_filters, query_plan
+
+
+@pytest.fixture(scope='module', autouse=True)
+def products(app):
+    with app.app_context():
+        db.session.add_all(Products(pid=f"p{n:04d}", product_name=f"product {n}", category=('electronics', 'books', 'toys')[n % 3],
+                                    price_in_dollar=10.0 + n, price_in_inr=830.0 + n, price_category=('Cheap', 'Expensive')[n % 2],
+                                    quantity=n % 7, return_rate=1.5, uid=f"u{n % 20}", user_name=f"user {n % 20}",
+                                    branch=('kukatpally', 'ameerpet')[n % 2])
+                           for n in range(300))
+        db.session.commit()
+    yield
+    with app.app_context():
+        db.session.execute(db.delete(Products))
+        db.session.commit()
+
+
+@contextmanager
+def product_selects(app):
+    """ Collect the SELECTs on Products that run inside the block, with their parameters """
+    statements = []
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT') and '"Products"' in statement:
+            statements.append((statement, parameters))
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', capture)
+
+
+def explain(app, statement, parameters):
+    with app.app_context(), db.engine.connect() as connection:
+        return '; '.join(row[-1] for row in connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters))
+
+
+def test_analytic_filters_use_their_indexes(app):
+    with app.app_context():
+        for index_name, query in indexed_filters():
+            assert index_name in query_plan(query), index_name
+
+
+@pytest.mark.parametrize('args, index_name', [
+    ('category=electronics', 'ix_Products_category'),
+    ('branch=kukatpally', 'ix_Products_branch'),
+    ('price_category=Expensive', 'ix_Products_price_category'),
+    ('category=books&sort=price_in_dollar&order=desc', 'ix_Products_category'),
+])
+def test_filtered_listing_uses_the_filter_index(app, client, args, index_name):
+    with product_selects(app) as statements:
+        response = client.get(f'/showproductdata?{args}')
+    assert response.status_code == 200
+    # The last SELECT is the page itself, the ones before only check there is data at all
+    statement, parameters = statements[-1]
+    assert 'WHERE' in statement
+    assert index_name in explain(app, statement, parameters)
+
+
+def test_listing_pages_seek_on_the_primary_key(app, client):
+    first = client.get('/showproductdata?limit=50')
+    assert first.status_code == 200
+    cursor = unquote(re.search(r'after=([^&"]+)', first.get_data(as_text=True)).group(1))
+    with product_selects(app) as statements:
+        response = client.get(f'/showproductdata?limit=50&after={cursor}')
+    assert response.status_code == 200
+    # The seek past the previous page is a range search on the key, not a scan of every row before it
+    plan = explain(app, *statements[-1])
+    assert 'SEARCH Products USING INDEX' in plan and '(pid>?)' in plan, plan
@@ -0,0 +1,58 @@
+import pytest
+
+from app import SalesSummary, check_sales_summary, db, rebuild_sales_summary, save_products
+from synthetic import products
+
+
+@pytest.fixture
+def empty_summary(app, empty_products):
+    with app.app_context():
+        db.session.execute(db.delete(SalesSummary))
+        db.session.commit()
+    yield
+    with app.app_context():
+        db.session.execute(db.delete(SalesSummary))
+        db.session.commit()
+
+
+def summary():
+    return {(row.category, row.branch): (row.total_sales, row.product_count, row.total_quantity, row.top_pid)
+            for row in SalesSummary.query.all()}
+
+
+def test_loads_fold_their_batches_into_the_summary(app, empty_summary):
+    with app.app_context():
+        save_products(products(4, branch=['ameerpet', 'ameerpet', 'kukatpally', 'ameerpet'], quantity=[3, 5, 2, 1]))
+        assert summary() == {('home', 'ameerpet'): (166 * 9, 3, 9, 'p1'), ('home', 'kukatpally'): (166 * 2, 1, 2, 'p2')}
+        assert check_sales_summary().empty
+
+
+def test_upserts_move_rows_between_groups_and_refresh_the_top_seller(app, empty_summary):
+    with app.app_context():
+        save_products(products(3, quantity=[3, 5, 2]))
+        # p1, the top seller, moves to another branch and p2 sells more
+        save_products(products(3, quantity=[3, 5, 4], branch=['ameerpet', 'kukatpally', 'ameerpet']), incremental=True)
+        assert summary() == {('home', 'ameerpet'): (166 * 7, 2, 7, 'p2'), ('home', 'kukatpally'): (166 * 5, 1, 5, 'p1')}
+        assert check_sales_summary().empty
+
+
+def test_deleting_a_product_takes_it_out_of_the_summary(app, client, empty_summary):
+    with app.app_context():
+        save_products(products(3, quantity=[3, 5, 2], branch=['ameerpet', 'ameerpet', 'kukatpally']))
+    assert client.post('/delete_product/p1').status_code == 302
+    assert client.post('/delete_product/p2').status_code == 302
+    with app.app_context():
+        # The top seller of ameerpet is looked up again, and kukatpally's emptied group is dropped
+        assert summary() == {('home', 'ameerpet'): (166 * 3, 1, 3, 'p0')}
+        assert check_sales_summary().empty
+
+
+def test_check_reports_groups_that_drifted_and_rebuild_repairs_them(app, empty_summary):
+    with app.app_context():
+        save_products(products(3, quantity=[3, 5, 2]))
+        db.session.execute(db.update(SalesSummary).values(total_quantity=SalesSummary.total_quantity + 1))
+        db.session.commit()
+        assert list(check_sales_summary().index) == [('home', 'ameerpet')]
+        assert rebuild_sales_summary() == 1
+        assert check_sales_summary().empty
+        assert summary() == {('home', 'ameerpet'): (166 * 10, 3, 10, 'p1')}
@@ -0,0 +1,41 @@
+import pytest
+
+from app import Products, Users, _staging_path, db, load_staged, stage_dataset, staged_version, write_arrow
+from synthetic import products
+
+
+@pytest.fixture
+def owner(app, client, empty_products):
+    """ The signed-in test client's user, with nothing staged """
+    with app.app_context():
+        owner = str(Users.query.filter_by(username='tester').one().id)
+        while (version := staged_version(owner)) is not None:
+            load_staged(owner, version)
+        db.session.execute(db.delete(Products))
+        db.session.commit()
+        yield owner
+
+
+def stored_quantities():
+    return sorted(set(db.session.execute(db.select(Products.quantity)).scalars()))
+
+
+@pytest.mark.parametrize('incremental', ['0', '1'])
+def test_loading_the_newest_version_leaves_no_older_one_to_load_again(app, client, owner, incremental):
+    stage_dataset(owner, products(3, quantity=1))
+    stage_dataset(owner, products(3, quantity=2))
+    assert client.get(f'/getproductdata?incremental={incremental}').status_code == 302
+    assert staged_version(owner) is None
+    # Nothing left to load, so the rows stay as the newest version left them
+    assert client.get(f'/getproductdata?incremental={incremental}').get_json() == {"message": "No processed data available"}
+    assert stored_quantities() == [2]
+
+
+def test_an_older_version_that_finished_staging_late_is_dropped_with_the_newest(app, owner):
+    newest = stage_dataset(owner, products(3, quantity=2))
+    # A run that started first but finished writing after the newest was staged
+    write_arrow(_staging_path(owner, newest - 1), products(3, quantity=1))
+    assert staged_version(owner) == newest
+    load_staged(owner, newest)
+    assert staged_version(owner) is None
+    assert stored_quantities() == [2]
@@ -0,0 +1,47 @@
+import os
+
+import pandas as pd
+import pytest
+
+from app import Products, db, getandcleandata, read_source, stream_ingest
+
+data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """ The sample sources as CSV, a JSON array and an HTML table, the last one repeating pids of the first """
+    first = pd.read_csv(os.path.join(data_dir, 'f1.csv'))
+    paths = [os.path.join(data_dir, 'f2.csv'), str(tmp_path / 'f3.json'), str(tmp_path / 'f4.html'), str(tmp_path / 'f1.html')]
+    pd.read_csv(os.path.join(data_dir, 'f3.csv')).to_json(paths[1], orient='records')
+    pd.read_csv(os.path.join(data_dir, 'f4.csv')).to_html(paths[2], index=False)
+    first.assign(product_name='repeated').to_html(paths[3], index=False)
+    return [os.path.join(data_dir, 'f1.csv')] + paths
+
+
+def loaded_products():
+    columns = ['pid', 'product_name', 'category', 'price_in_dollar', 'quantity', 'return_rate', 'branch']
+    rows = db.session.execute(db.select(*[Products.__table__.c[column] for column in columns]).order_by(Products.pid)).all()
+    return pd.DataFrame(rows, columns=columns)
+
+
+def test_streaming_loads_what_the_all_at_once_path_cleans(app, sources, empty_products):
+    with app.app_context():
+        expected = getandcleandata(pd.concat([read_source(path) for path in sources], ignore_index=True))
+        assert stream_ingest(sources, 2, 'stream-test') == len(expected)
+        loaded = loaded_products()
+    expected = expected.sort_values('pid', ignore_index=True)
+    assert loaded['pid'].tolist() == expected['pid'].tolist()
+    # The first row of a repeated pid wins, even when the repeat is in another chunk and source
+    assert 'repeated' not in loaded['product_name'].tolist()
+    assert loaded['quantity'].tolist() == expected['quantity'].tolist()
+
+
+def test_a_failing_chunk_stops_the_run_before_any_product_is_written(app, sources, tmp_path, empty_products):
+    bad = tmp_path / 'bad.csv'
+    pd.read_csv(os.path.join(data_dir, 'f5.csv')).assign(quantity=5000).to_csv(bad, index=False)
+    with app.app_context():
+        with pytest.raises(ValueError, match='Quantity'):
+            stream_ingest(sources + [str(bad)], 2, 'stream-test')
+        assert loaded_products().empty
+    assert not os.listdir(os.path.join(app.config['STAGING_DIR'], 'stream-test'))
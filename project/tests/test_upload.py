@@ -0,0 +1,42 @@
+import io
+import os
+
+import pytest
+
+import app as app_module
+from app import Products, db
+from synthetic import make_products
+
+
+@pytest.fixture
+def source():
+    """ A raw products CSV as a client would upload it """
+    return make_products(20).to_csv(index=False).encode()
+
+
+def upload(client, source, query=''):
+    return client.post(f'/upload{query}', data={'file': (io.BytesIO(source), 'products.csv')},
+                       content_type='multipart/form-data')
+
+
+def test_uploads_are_streamed_by_default(app, client, empty_products, source, monkeypatch):
+    def read_at_once(*args, **kwargs):
+        raise AssertionError("the upload was read into memory")
+    monkeypatch.setattr(app_module, 'read_sources', read_at_once)
+    assert upload(client, source).status_code == 302
+    with app.app_context():
+        assert db.session.query(Products).count() == 20
+    assert os.listdir(app.config['UPLOAD_DIR']) == []
+
+
+def test_uploads_over_the_memory_limit_cannot_be_read_at_once(app, client, empty_products, source, monkeypatch):
+    monkeypatch.setitem(app.config, 'UPLOAD_MEMORY_MAX_BYTES', len(source) - 1)
+    response = upload(client, source, '?mode=memory')
+    assert response.status_code == 413
+    assert os.listdir(app.config['UPLOAD_DIR']) == []
+    monkeypatch.setitem(app.config, 'UPLOAD_MEMORY_MAX_BYTES', len(source))
+    # Read at once, the upload is staged until the user loads it
+    assert upload(client, source, '?mode=memory').status_code == 302
+    assert client.get('/getproductdata').status_code == 302
+    with app.app_context():
+        assert db.session.query(Products).count() == 20
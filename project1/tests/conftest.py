@@ -0,0 +1,47 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+# The app reads its settings when imported, so point it at a scratch SQLite database and
+# scratch files and directories before that, whatever DATABASE_URL the environment exports
+scratch_dir = tempfile.mkdtemp(prefix='project1-tests-')
+os.environ['DB_TYPE'] = 'sqlite'
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(scratch_dir, 'test.db')
+for name in ('SOURCE_CACHE_DIR', 'STAGING_DIR', 'UPLOAD_DIR', 'CHART_DIR'):
+    os.environ[name] = os.path.join(scratch_dir, name.lower())
+os.environ['USER_CACHE_STAMP'] = os.path.join(scratch_dir, 'users.stamp')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def app():
+    from app import app, db
+    app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    with app.app_context():
+        db.create_all()
+    yield app
+    shutil.rmtree(scratch_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope='session')
+def client(app):
+    client = app.test_client()
+    account = {'username': 'tester', 'password': 'pw123456'}
+    client.post('/register_page', data={**account, 'confirm_password': account['password'], 'role': 'admin'})
+    client.post('/login_page', data=account)
+    return client
+
+
+@pytest.fixture
+def empty_students(app):
+    from app import Student, db
+    with app.app_context():
+        db.session.execute(db.delete(Student))
+        db.session.commit()
+    yield
+    with app.app_context():
+        db.session.execute(db.delete(Student))
+        db.session.commit()
@@ -0,0 +1,34 @@
+""" The ETL functions as they were before the rewrites, kept as a reference for the tests """
+import pandas as pd
+
+
+def legacy_getandcleandata(dataset):
+    """ The row-wise cleaning function as it was before vectorization """
+    dataset.dropna(inplace=True)
+    dataset.drop_duplicates(subset=['sid'], inplace=True)
+    dataset['mid1'] = pd.to_numeric(dataset['mid1'], errors='coerce')
+    dataset['mid2'] = pd.to_numeric(dataset['mid2'], errors='coerce')
+    if (dataset['mid1'] < 0).any():
+        dataset['mid1'] = dataset['mid1'].clip(lower=0)
+    if (dataset['mid2'] < 0).any():
+        dataset['mid2'] = dataset['mid2'].clip(lower=0)
+    dataset['gpa'] = dataset['gpa'].astype(str).str.strip().str.lower()
+    dataset['gpa'] = dataset['gpa'].replace('fail', 0)
+    dataset['gpa'] = pd.to_numeric(dataset['gpa'], errors='coerce')
+    dataset['mid1'] += 10
+    dataset['mid2'] += 10
+    dataset['mid_avg'] = (dataset['mid1'] + dataset['mid2']) / 2
+    dataset['percentage'] = (dataset['gpa'] / 10) * 100
+    dataset['status'] = dataset['gpa'].apply(lambda x: 'fail' if x <= 6 else 'pass')
+    return dataset.dropna()
+
+
+def legacy_save_students(dataset):
+    """ The ORM loader as it was before the bulk load engine """
+    from app import Student, db
+    student_records = [
+        Student(**{column: row[column] for column in dataset.columns})
+        for _, row in dataset.iterrows()
+    ]
+    db.session.bulk_save_objects(student_records)
+    db.session.commit()
@@ -0,0 +1,218 @@
+""" Benchmarks of the ETL stages and the per-request overheads, with the legacy code they replaced as baselines.
+They run with the other tests on small inputs; for real numbers run them alone on more rows, and save a run
+to compare later ones against:
+
+    BENCHMARK_ROWS=1000000 python -m pytest tests/test_benchmarks.py --benchmark-only --benchmark-autosave
+    BENCHMARK_ROWS=1000000 python -m pytest tests/test_benchmarks.py --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:20%
+
+Everything runs against the scratch SQLite database of conftest.py, never DATABASE_URL """
+import os
+import re
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+import app as app_module
+from app import (RejectedStudent, Student, StudentSummary, Users, bump_data_version, db, evict_source_cache,
+                 getandcleandata, hash_password, read_source, save_students)
+from legacy import legacy_getandcleandata, legacy_save_students
+from synthetic import make_students, source_formats, write_sources
+
+# Rows of synthetic data, and the fraction of them with one dirty value for the stages that handle those
+rows = int(os.getenv('BENCHMARK_ROWS', 5000))
+dirty = float(os.getenv('BENCHMARK_DIRTY', 0.05))
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def reset_data(app):
+    """ Empties the tables an ETL run fills, keeping users and data versions so caches see new versions """
+    def reset():
+        for model in (RejectedStudent, StudentSummary, Student):
+            db.session.query(model).delete()
+        db.session.commit()
+    with app.app_context():
+        reset()
+        yield reset
+        reset()
+
+
+@pytest.fixture(scope='module')
+def sources(tmp_path_factory):
+    return write_sources(make_students, rows, str(tmp_path_factory.mktemp('sources')), dirty=dirty)
+
+
+# A tenth of the rows dirty, which includes the 'fail' GPAs the source files have
+students_dirt = 0.1
+
+
+@pytest.mark.benchmark(group='clean')
+def test_clean_legacy_row_wise(benchmark):
+    source = make_students(rows, dirty=students_dirt)
+    benchmark.pedantic(legacy_getandcleandata, setup=lambda: ((source.copy(),), {}), rounds=3)
+
+
+@pytest.mark.benchmark(group='clean')
+def test_clean_vectorized(app, benchmark):
+    source = make_students(rows, dirty=students_dirt)
+    with app.app_context():
+        cleaned = benchmark.pedantic(getandcleandata, setup=lambda: ((source.copy(),), {}), rounds=3)
+    assert 0 < len(cleaned) <= rows
+
+
+@pytest.mark.benchmark(group='clean')
+def test_clean_quarantining_dirty_rows(app, benchmark):
+    source = make_students(rows, dirty=dirty)
+    with app.app_context():
+        cleaned = benchmark.pedantic(getandcleandata, setup=lambda: ((source.copy(), []), {}), rounds=3)
+    assert isinstance(cleaned, pd.DataFrame)
+
+
+@pytest.mark.benchmark(group='load')
+@pytest.mark.parametrize('loader', [legacy_save_students, save_students], ids=['orm-legacy', 'bulk-load'])
+def test_load(benchmark, reset_data, loader):
+    cleaned = getandcleandata(make_students(rows, dirty=students_dirt))
+    benchmark.pedantic(loader, args=(cleaned,), setup=reset_data, rounds=3)
+    assert db.session.query(Student).count() == len(cleaned)
+
+
+@pytest.mark.benchmark(group='parse')
+@pytest.mark.parametrize('fmt', list(source_formats))
+def test_parse(benchmark, sources, fmt):
+    path = next(path for path in sources if path.endswith(source_formats[fmt][0]))
+    assert len(benchmark(read_source, path))
+
+
+# Modules app.py must not import until a route or command needs them
+heavy_modules = ('pandas', 'numpy', 'matplotlib', 'seaborn', 'psycopg2', 'pyarrow')
+
+
+def run_python(*command):
+    return subprocess.run([sys.executable, *command], cwd=app_dir, check=True, capture_output=True, text=True).stdout
+
+
+def test_importing_the_app_leaves_the_heavy_modules_unloaded():
+    loaded = run_python('-c', f"import app, sys; print(' '.join(m for m in {heavy_modules!r} if m in sys.modules))")
+    assert loaded.split() == []
+
+
+@pytest.mark.benchmark(group='startup')
+@pytest.mark.parametrize('command', [
+    ('-c', 'import app'),
+    ('-c', 'import app, pandas, matplotlib.pyplot, seaborn'),
+    ('-m', 'flask', '--app', 'app', 'db', 'heads'),
+], ids=['import-app', 'import-app-with-chart-and-etl-libs', 'flask-db-heads'])
+def test_cold_start(benchmark, command):
+    benchmark.pedantic(run_python, args=command, rounds=3)
+
+
+@pytest.mark.benchmark(group='request')
+def test_request(benchmark, client):
+    benchmark(client.get, '/login_page')
+
+
+@pytest.mark.benchmark(group='request')
+def test_request_with_legacy_schema_hook(benchmark, app, client):
+    # The hook as it was, reflecting and creating the schema before every request
+    app.before_request_funcs.setdefault(None, []).insert(0, db.create_all)
+    try:
+        benchmark(client.get, '/login_page')
+    finally:
+        app.before_request_funcs[None].remove(db.create_all)
+
+
+@pytest.fixture(scope='module')
+def login_account(app):
+    account = {'username': 'bench_login', 'password': 'pw123456'}
+    with app.app_context():
+        Users.query.filter_by(username=account['username']).delete()
+        db.session.add(Users(username=account['username'], password=hash_password(account['password']), role='user'))
+        db.session.commit()
+    return account
+
+
+@pytest.mark.benchmark(group='login')
+def test_login(benchmark, app, login_account):
+    assert benchmark(lambda: app.test_client().post('/login_page', data=login_account).status_code) == 302
+
+
+@pytest.mark.benchmark(group='login')
+def test_login_burst_from_concurrent_clients(benchmark, app, login_account):
+    # 8 clients logging in twice each, hashed on the PASSWORD_HASH_WORKERS pool
+    def burst():
+        with ThreadPoolExecutor(8) as pool:
+            return list(pool.map(lambda _: app.test_client().post('/login_page', data=login_account).status_code, range(16)))
+    assert set(benchmark.pedantic(burst, rounds=3)) == {302}
+
+
+@pytest.mark.benchmark(group='metrics')
+def test_request_metrics_hooks(benchmark, app, monkeypatch):
+    monkeypatch.setitem(app.config, 'METRICS_ENABLED', True)
+    response = app.response_class()
+    with app.test_request_context('/login_page'):
+        app_module.request.url_rule = next(app.url_map.iter_rules('login_page'))
+
+        def hooks():
+            app_module.start_request_metrics()
+            app_module.record_request_metrics(response)
+        benchmark(hooks)
+
+
+@pytest.mark.benchmark(group='metrics')
+def test_query_metrics_hooks(benchmark, app, monkeypatch):
+    monkeypatch.setitem(app.config, 'METRICS_ENABLED', True)
+    context = SimpleNamespace()
+
+    def hooks():
+        app_module.start_query_metrics(None, None, None, None, context, False)
+        app_module.record_query_metrics(None, None, None, None, context, False)
+    benchmark(hooks)
+
+
+# The analysis routes in the order a user goes through them: run the ETL, load the staged rows, then open the dashboard
+@pytest.mark.benchmark(group='routes')
+def test_route_analysis(benchmark, app, client, sources, reset_data, monkeypatch):
+    monkeypatch.setattr(app_module, 'source_paths', sources)
+
+    def cold():
+        # Every round parses the sources again
+        reset_data()
+        evict_source_cache(0)
+    response = benchmark.pedantic(client.get, args=('/analysis?quarantine=1',), setup=cold, rounds=3)
+    assert response.status_code == 200
+
+
+@pytest.mark.benchmark(group='routes')
+def test_route_load(benchmark, app, client, sources, reset_data, monkeypatch):
+    monkeypatch.setattr(app_module, 'source_paths', sources)
+
+    def staged():
+        reset_data()
+        client.get('/analysis?quarantine=1')
+    response = benchmark.pedantic(client.get, args=('/showdata',), setup=staged, rounds=3)
+    assert response.status_code == 200
+    assert db.session.query(Student).count()
+
+
+@pytest.mark.benchmark(group='routes')
+def test_route_dashboard(benchmark, app, client, reset_data):
+    save_students(getandcleandata(make_students(rows)))
+
+    def dashboard():
+        # The charts and their data are fetched as a browser would
+        page = client.get('/student_analysis')
+        for linked in re.findall(r'(?:src|href)="(/student_analysis/[^"]+)"', page.get_data(as_text=True)):
+            assert client.get(linked.replace('&amp;', '&'), follow_redirects=True).status_code == 200
+        return page
+
+    def new_version():
+        # A new data version, so the charts are rendered again rather than served from the cache
+        bump_data_version('Students')
+        db.session.commit()
+    assert benchmark.pedantic(dashboard, setup=new_version, rounds=3).status_code == 200
@@ -0,0 +1,69 @@
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from app import Student, bulk_load, bulk_writer, db
+from synthetic import students
+
+columns = ['sid', 'name', 'gpa']
+rows = [('s1', 'tab\there', 8.5), ('s2', None, None)]
+
+
+class RecordingCursor:
+    """ Stands in for a DB-API cursor, recording what the writer sends """
+    def __init__(self):
+        self.calls = []
+    def execute(self, sql, parameters=None):
+        self.calls.append(('execute', sql, parameters))
+    def executemany(self, sql, parameters):
+        self.calls.append(('executemany', sql, list(parameters)))
+    def copy_expert(self, sql, source):
+        self.calls.append(('copy', sql, source.read()))
+
+
+def written(dialect, upsert_key=None):
+    cursor = RecordingCursor()
+    bulk_writer(dialect, Student.__table__, columns, upsert_key)(cursor, rows)
+    return cursor.calls
+
+
+def test_postgresql_copies_the_rows_as_text():
+    [(kind, sql, data)] = written(postgresql.psycopg2.dialect())
+    assert (kind, sql) == ('copy', 'COPY "Students" (sid, name, gpa) FROM STDIN')
+    assert data == 's1\ttab\\there\t8.5\ns2\t\\N\t\\N\n'
+
+
+def test_postgresql_upserts_through_a_temporary_table():
+    calls = written(postgresql.psycopg2.dialect(), upsert_key='sid')
+    assert [kind for kind, _, _ in calls] == ['execute', 'copy', 'execute', 'execute']
+    assert calls[1][1] == 'COPY "Students_load" (sid, name, gpa) FROM STDIN'
+    assert calls[2][1] == ('INSERT INTO "Students" (sid, name, gpa) SELECT sid, name, gpa '
+                           'FROM "Students_load" ON CONFLICT (sid) DO UPDATE SET name = excluded.name, '
+                           'gpa = excluded.gpa')
+
+
+def test_postgresql_drivers_without_copy_use_their_paramstyle():
+    [(kind, sql, parameters)] = written(postgresql.pg8000.dialect())
+    assert kind == 'executemany' and parameters == rows
+    assert sql == 'INSERT INTO "Students" (sid, name, gpa) VALUES (%s, %s, %s)'
+
+
+def test_mysql_sends_one_multi_row_statement():
+    [(kind, sql, parameters)] = written(mysql.mysqldb.dialect(), upsert_key='sid')
+    assert kind == 'execute'
+    assert sql == ('INSERT INTO `Students` (sid, name, gpa) VALUES (%s, %s, %s), (%s, %s, %s)'
+                   ' ON DUPLICATE KEY UPDATE name = VALUES(name), gpa = VALUES(gpa)')
+    assert parameters == [value for row in rows for value in row]
+
+
+def test_sqlite_uses_executemany():
+    [(kind, sql, parameters)] = written(sqlite.pysqlite.dialect(), upsert_key='sid')
+    assert kind == 'executemany' and parameters == rows
+    assert sql.startswith('INSERT INTO "Students" (sid, name, gpa) VALUES (?, ?, ?) ON CONFLICT (sid)')
+
+
+def test_bulk_load_inserts_and_upserts_in_batches(app, empty_students):
+    with app.app_context():
+        assert bulk_load(Student, students(5, row_hash=['0' * 16] * 4 + [None]), batch_size=2) == 5
+        assert Student.query.filter_by(sid='s4').one().row_hash is None
+        bulk_load(Student, students(7, gpa=5.0), batch_size=3, upsert_key='sid')
+        gpas = db.session.execute(db.select(Student.gpa)).scalars().all()
+    assert gpas == [5.0] * 7
@@ -0,0 +1,39 @@
+import os
+
+import pandas as pd
+import pytest
+
+from app import getandcleandata
+from legacy import legacy_getandcleandata
+
+data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+def sample():
+    return pd.concat([pd.read_csv(os.path.join(data_dir, f"f{n}.csv")) for n in range(1, 6)], ignore_index=True)
+
+
+def with_rows(*rows):
+    """ The sample sources with some rows added, as the readers would give them """
+    data = sample().astype(object)
+    return pd.concat([data, pd.DataFrame([dict(zip(data.columns, row)) for row in rows])], ignore_index=True)
+
+
+@pytest.mark.parametrize('make', [
+    sample,
+    # Missing values and repeated sids are dropped, the first row of a sid wins
+    lambda: with_rows(('s90', 'ravi', 10, 12, 40, 8), ('s91', 'sita', 10, None, 40, 8), ('s01', 'ravi', 1, 2, 3, 4)),
+    # Negative marks are clipped, numbers read as text are parsed and 'fail' in any case is a GPA of 0
+    lambda: with_rows(('s92', 'anil', '-3', '14', '50', ' FAIL '), ('s93', 'usha', 7, -1, 60, '6.5')),
+    # Marks and GPAs that do not parse drop their rows
+    lambda: with_rows(('s94', 'ram', 'absent', 12, 40, 8), ('s95', 'gopi', 10, 12, 40, 'n/a')),
+], ids=['sample', 'nulls-and-repeats', 'fixed-up', 'unparseable'])
+def test_cleaning_matches_the_row_wise_version(app, make):
+    with app.app_context():
+        cleaned = getandcleandata(make())
+    expected = legacy_getandcleandata(make())
+    assert isinstance(cleaned, pd.DataFrame)
+    assert cleaned.index.tolist() == expected.index.tolist()
+    assert cleaned.columns.tolist() == expected.columns.tolist()
+    # The dtypes are narrower now (downcast marks, categorical status), the values are the same
+    pd.testing.assert_frame_equal(cleaned.astype({'status': str}), expected, check_dtype=False)
@@ -0,0 +1,23 @@
+from app import data_version, rebuild_student_summary, save_students
+from synthetic import students
+
+
+def test_every_students_write_moves_the_data_version(app, client, empty_students, monkeypatch):
+    monkeypatch.setitem(app.config, 'BULK_BATCH_SIZE', 2)
+    with app.app_context():
+        start, _ = data_version('Students')
+        # One bump per committed batch
+        save_students(students(5))
+        assert data_version('Students')[0] == start + 3
+        # Nothing new or changed, so nothing is written and the rendered charts stay valid
+        save_students(students(5), incremental=True)
+        assert data_version('Students')[0] == start + 3
+        save_students(students(5, gpa=9.0), incremental=True)
+        assert data_version('Students')[0] == start + 6
+        rebuild_student_summary()
+        assert data_version('Students')[0] == start + 7
+    client.get('/delete_student/s0')
+    with app.app_context():
+        version, updated_at = data_version('Students')
+    assert version == start + 8
+    assert updated_at.tzinfo is not None
@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from app import save_students
+from synthetic import students
+
+
+@pytest.fixture
+def stored(app, empty_students):
+    with app.app_context():
+        save_students(students(3))
+
+
+@pytest.mark.parametrize('export_format', ['ndjson', 'csv'])
+def test_fields_asked_for_twice_are_exported_once(client, stored, export_format):
+    response = client.get(f'/export/students?fields=sid,gpa,sid&format={export_format}')
+    assert response.status_code == 200
+    body = response.get_data(as_text=True)
+    if export_format == 'ndjson':
+        assert [json.loads(line) for line in body.splitlines()] == [{'sid': f"s{i}", 'gpa': 8.0} for i in range(3)]
+    else:
+        assert body.splitlines() == ['sid,gpa', 's0,8.0', 's1,8.0', 's2,8.0']
+
+
+def test_unknown_fields_are_refused_before_streaming(client, stored):
+    response = client.get('/export/students?fields=sid,password')
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "Unknown fields: password"}
@@ -0,0 +1,22 @@
+from app import Student, db, row_hashes, save_students
+from synthetic import students
+
+
+def test_incremental_reruns_write_only_new_and_changed_rows(app, empty_students):
+    with app.app_context():
+        assert save_students(students(5)) == 5
+        assert save_students(students(5), incremental=True) == 0
+        changed = students(6)
+        changed.loc[2, 'gpa'] = 5.5
+        # The changed row and the new one, upserted on sid
+        assert save_students(changed, incremental=True) == 2
+        stored = dict(db.session.execute(db.select(Student.sid, Student.gpa)).all())
+    assert stored == {'s0': 8.0, 's1': 8.0, 's2': 5.5, 's3': 8.0, 's4': 8.0, 's5': 8.0}
+
+
+def test_row_hashes_do_not_depend_on_the_dtypes_a_source_was_read_with():
+    columns = ['sid', 'name', 'mid1', 'semester', 'gpa']
+    from_csv = students(3)[columns]
+    from_html = from_csv.astype({'mid1': 'int8', 'semester': 'float64', 'sid': object})
+    assert row_hashes(from_csv, columns) == row_hashes(from_html, columns)
+    assert row_hashes(from_csv, columns) != row_hashes(from_csv.assign(gpa=7.0), columns)
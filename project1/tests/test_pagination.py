@@ -0,0 +1,50 @@
+import base64
+import json
+
+import pytest
+
+from app import Student, decode_cursor, encode_cursor, keyset_page, save_students
+from synthetic import students
+
+
+def cursor_of(value):
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+
+@pytest.fixture
+def stored_students(app, empty_students):
+    with app.app_context():
+        save_students(students(7, gpa=[5.0, 3.0, 5.0, 1.0, 4.0, 3.0, 2.0]))
+    yield
+
+
+def test_keyset_pages_walk_every_row_once_in_order(app, stored_students):
+    seen = []
+    cursor = None
+    with app.app_context():
+        while True:
+            rows, cursor = keyset_page(Student.query, Student.sid, Student.gpa, True, cursor, 3)
+            seen += [(row.gpa, row.sid) for row in rows]
+            if cursor is None:
+                break
+    assert seen == sorted(seen, reverse=True)
+    assert len(seen) == len(set(seen)) == 7
+
+
+def test_cursors_round_trip_the_sort_position():
+    assert decode_cursor(encode_cursor([2.0, 's4']), [Student.gpa, Student.sid]) == [2.0, 's4']
+    # A whole number may come back as a JSON integer, which still fits a float column
+    assert decode_cursor(cursor_of([3, 's1']), [Student.gpa, Student.sid]) == [3, 's1']
+
+
+@pytest.mark.parametrize('after', [
+    'not base64!', cursor_of('s1')[:-2], base64.urlsafe_b64encode(b'\xff\xfe').decode(), cursor_of({'sid': 's1'}),
+    cursor_of(['s1', 's2']), cursor_of([{'$gt': 1}, 's1']), cursor_of([[1], 's1']), cursor_of(['cheap', 's1']),
+    cursor_of([True, 's1']), cursor_of([None, 's1']), cursor_of([2.0, 4]),
+    base64.urlsafe_b64encode(b'[' * 5000).decode(),
+], ids=['garbage', 'truncated', 'not-utf8', 'object', 'too-long', 'dict-value', 'list-value', 'text-for-float',
+        'bool', 'null', 'number-for-text', 'deeply-nested'])
+def test_tampered_cursors_are_rejected_with_400(client, stored_students, after):
+    response = client.get('/showdata', query_string={'sort': 'gpa', 'after': after})
+    assert response.status_code == 400
+    assert response.get_json() == {"message": "Invalid page cursor."}
@@ -0,0 +1,89 @@
+import os
+
+import pandas as pd
+import pytest
+
+import app as app_module
+from app import (RejectedStudent, Student, _rejects_path, db, discard_staged, getandcleandata, load_staged,
+                 save_students, stage_dataset)
+
+
+def raw_students(n, **changes):
+    """ Raw students as read from a source, before cleaning """
+    return pd.DataFrame({'sid': [f"q{i}" for i in range(n)], 'name': 'ravi', 'mid1': 10, 'mid2': 12,
+                         'semester': 40, 'gpa': 8}).astype(object).assign(**changes)
+
+
+@pytest.fixture
+def empty_rejects(app, empty_students):
+    with app.app_context():
+        db.session.execute(db.delete(RejectedStudent))
+        db.session.commit()
+    yield
+    with app.app_context():
+        db.session.execute(db.delete(RejectedStudent))
+        db.session.commit()
+
+
+def stored_rejects():
+    return sorted(db.session.execute(db.select(RejectedStudent.sid, RejectedStudent.rule)).all())
+
+
+def test_quarantine_mode_sets_unparseable_rows_aside_with_the_first_rule_they_failed():
+    data = raw_students(4)
+    data.loc[1, 'mid1'] = 'absent'
+    data.loc[3, 'gpa'] = 'n/a'
+    rejects = []
+    cleaned = getandcleandata(data, rejects)
+    assert cleaned['sid'].tolist() == ['q0', 'q2']
+    records = pd.concat(rejects)
+    assert records[['sid', 'rule']].values.tolist() == [['q1', 'invalid_marks'], ['q3', 'invalid_gpa']]
+    assert '"sid":"q1"' in records['row_data'].iloc[0]
+
+
+def test_rejects_are_loaded_with_the_staged_dataset(app, empty_rejects):
+    data = raw_students(5, gpa=[8, 'n/a', 8, 8, 'n/a'])
+    with app.app_context():
+        rejects = []
+        version = stage_dataset('quarantine', getandcleandata(data, rejects), rejects)
+        assert load_staged('quarantine', version) == 3
+        assert stored_rejects() == [('q1', 'invalid_gpa'), ('q4', 'invalid_gpa')]
+        assert db.session.scalar(db.select(db.func.count()).select_from(Student)) == 3
+    assert not os.path.exists(_rejects_path('quarantine', version))
+
+
+def test_rejects_roll_back_with_a_failing_batch(app, empty_rejects):
+    data = raw_students(3, gpa=[8, 'n/a', 8])
+    with app.app_context():
+        rejects = []
+        cleaned = getandcleandata(data, rejects)
+        # The stored sid makes the plain insert of the staged batch fail
+        save_students(cleaned.iloc[:1])
+        version = stage_dataset('quarantine', cleaned, rejects)
+        with pytest.raises(Exception):
+            load_staged('quarantine', version)
+        assert stored_rejects() == []
+        # Still staged, so a retry writes them with the batch
+        assert os.path.exists(_rejects_path('quarantine', version))
+        discard_staged('quarantine', version)
+
+
+def test_rejects_are_inserted_in_bulk_batch_size_statements(app, empty_rejects, monkeypatch):
+    monkeypatch.setitem(app.config, 'BULK_BATCH_SIZE', 2)
+    statements = []
+    bulk_writer = app_module.bulk_writer
+
+    def recording_writer(dialect, table, columns, upsert_key=None):
+        write = bulk_writer(dialect, table, columns, upsert_key)
+        def record(cursor, rows):
+            statements.append((table.name, len(rows)))
+            write(cursor, rows)
+        return record
+    monkeypatch.setattr(app_module, 'bulk_writer', recording_writer)
+    data = raw_students(6, gpa=[8] + ['n/a'] * 5)
+    with app.app_context():
+        rejects = []
+        version = stage_dataset('quarantine', getandcleandata(data, rejects), rejects)
+        load_staged('quarantine', version)
+        assert len(stored_rejects()) == 5
+    assert [size for name, size in statements if name == 'rejected_students'] == [2, 2, 1]
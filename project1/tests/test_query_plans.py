@@ -0,0 +1,75 @@
+import re
+from contextlib import contextmanager
+from urllib.parse import unquote
+
+import pytest
+from sqlalchemy import event
+
+from app import Student, db, indexed_filters, query_plan
+
+
+@pytest.fixture(scope='module', autouse=True)
+def students(app):
+    with app.app_context():
+        db.session.add_all(Student(sid=f"s{n:04d}", name=f"student {n}", mid1=20.0, mid2=25.0, mid_avg=22.5, semester=60.0 + n % 40,
+                                   gpa=(n % 100) / 10, percentage=50.0 + n % 50, status=('pass', 'fail')[n % 2])
+                           for n in range(300))
+        db.session.commit()
+    yield
+    with app.app_context():
+        db.session.execute(db.delete(Student))
+        db.session.commit()
+
+
+@contextmanager
+def student_selects(app):
+    """ Collect the SELECTs on Students that run inside the block, with their parameters """
+    statements = []
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT') and '"Students"' in statement:
+            statements.append((statement, parameters))
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', capture)
+
+
+def explain(app, statement, parameters):
+    with app.app_context(), db.engine.connect() as connection:
+        return '; '.join(row[-1] for row in connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters))
+
+
+def test_analytic_filters_use_their_indexes(app):
+    with app.app_context():
+        for index_name, query in indexed_filters():
+            assert index_name in query_plan(query), index_name
+
+
+@pytest.mark.parametrize('args, index_name', [
+    ('status=pass', 'ix_Students_status'),
+    ('min_gpa=8&sort=gpa', 'ix_Students_gpa'),
+    ('min_gpa=2&max_gpa=4', 'ix_Students_gpa'),
+    ('status=fail&sort=percentage&order=desc', 'ix_Students_status'),
+])
+def test_filtered_listing_uses_the_filter_index(app, client, args, index_name):
+    with student_selects(app) as statements:
+        response = client.get(f'/showdata?{args}')
+    assert response.status_code == 200
+    statement, parameters = statements[-1]
+    assert 'WHERE' in statement
+    assert index_name in explain(app, statement, parameters)
+
+
+def test_listing_pages_seek_on_the_key(app, client):
+    first = client.get('/showdata?limit=50')
+    assert first.status_code == 200
+    cursor = unquote(re.search(r'after=([^&"]+)', first.get_data(as_text=True)).group(1))
+    with student_selects(app) as statements:
+        response = client.get(f'/showdata?limit=50&after={cursor}')
+    assert response.status_code == 200
+    # The seek past the previous page is a range search on the key, not a scan of every row before it
+    plan = explain(app, *statements[-1])
+    assert 'SEARCH Students USING' in plan and '(sid>?)' in plan, plan
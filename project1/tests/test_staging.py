@@ -0,0 +1,41 @@
+import pytest
+
+from app import Student, Users, _staging_path, db, load_staged, stage_dataset, staged_version, write_arrow
+from synthetic import students
+
+
+@pytest.fixture
+def owner(app, client, empty_students):
+    """ The signed-in test client's user, with nothing staged """
+    with app.app_context():
+        owner = str(Users.query.filter_by(username='tester').one().id)
+        while (version := staged_version(owner)) is not None:
+            load_staged(owner, version)
+        db.session.execute(db.delete(Student))
+        db.session.commit()
+        yield owner
+
+
+def stored_gpas():
+    return sorted(set(db.session.execute(db.select(Student.gpa)).scalars()))
+
+
+@pytest.mark.parametrize('incremental', ['0', '1'])
+def test_every_view_after_the_newest_version_is_loaded_keeps_its_rows(app, client, owner, incremental):
+    stage_dataset(owner, students(3, gpa=5.0))
+    stage_dataset(owner, students(3, gpa=9.0))
+    # Every view of the listing loads what is staged, so the second finds nothing left
+    for _ in range(2):
+        assert client.get(f'/showdata?incremental={incremental}').status_code == 200
+        assert staged_version(owner) is None
+        assert stored_gpas() == [9.0]
+
+
+def test_an_older_version_that_finished_staging_late_is_dropped_with_the_newest(app, owner):
+    newest = stage_dataset(owner, students(3, gpa=9.0))
+    # A run that started first but finished writing after the newest was staged
+    write_arrow(_staging_path(owner, newest - 1), students(3, gpa=5.0))
+    assert staged_version(owner) == newest
+    load_staged(owner, newest)
+    assert staged_version(owner) is None
+    assert stored_gpas() == [9.0]
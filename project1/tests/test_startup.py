@@ -0,0 +1,31 @@
+import os
+import sqlite3
+import subprocess
+import sys
+
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(database, *command):
+    env = {**os.environ, 'DATABASE_URL': 'sqlite:///' + database}
+    return subprocess.run([sys.executable, *command], cwd=app_dir, env=env, check=True, capture_output=True, text=True).stdout
+
+
+def tables(database):
+    if not os.path.exists(database):
+        return []
+    with sqlite3.connect(database) as connection:
+        return [name for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+
+
+def test_a_serving_process_sets_up_an_empty_database_and_starts_the_job_monitor(tmp_path):
+    database = str(tmp_path / 'fresh.db')
+    threads = run_python(database, '-c', "import threading, app; print(' '.join(t.name for t in threading.enumerate()))")
+    assert 'etl-job-monitor' in threads.split()
+    assert 'alembic_version' in tables(database) and 'users' in tables(database)
+
+
+def test_cli_commands_leave_the_schema_to_the_migrations(tmp_path):
+    database = str(tmp_path / 'fresh.db')
+    run_python(database, '-m', 'flask', '--app', 'app', 'db', 'heads')
+    assert tables(database) == []
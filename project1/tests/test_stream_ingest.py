@@ -0,0 +1,47 @@
+import os
+
+import pandas as pd
+import pytest
+
+from app import Student, db, getandcleandata, read_source, stream_ingest
+
+data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """ The sample sources as CSV, a JSON array and an HTML table, the last one repeating sids of the first """
+    first = pd.read_csv(os.path.join(data_dir, 'f1.csv'))
+    paths = [os.path.join(data_dir, 'f2.csv'), str(tmp_path / 'f3.json'), str(tmp_path / 'f4.html'), str(tmp_path / 'f1.html')]
+    pd.read_csv(os.path.join(data_dir, 'f3.csv')).to_json(paths[1], orient='records')
+    pd.read_csv(os.path.join(data_dir, 'f4.csv')).to_html(paths[2], index=False)
+    first.assign(name='repeated').to_html(paths[3], index=False)
+    return [os.path.join(data_dir, 'f1.csv')] + paths
+
+
+def loaded_students():
+    columns = ['sid', 'name', 'mid1', 'mid2', 'semester', 'gpa', 'status']
+    rows = db.session.execute(db.select(*[Student.__table__.c[column] for column in columns]).order_by(Student.sid)).all()
+    return pd.DataFrame(rows, columns=columns)
+
+
+def test_streaming_loads_what_the_all_at_once_path_cleans(app, sources, empty_students):
+    with app.app_context():
+        expected = getandcleandata(pd.concat([read_source(path) for path in sources], ignore_index=True))
+        assert stream_ingest(sources, 2, 'stream-test') == len(expected)
+        loaded = loaded_students()
+    expected = expected.sort_values('sid', ignore_index=True)
+    assert loaded['sid'].tolist() == expected['sid'].tolist()
+    # The first row of a repeated sid wins, even when the repeat is in another chunk and source
+    assert 'repeated' not in loaded['name'].tolist()
+    assert loaded['gpa'].tolist() == expected['gpa'].tolist()
+
+
+def test_a_broken_source_stops_the_run_before_any_student_is_written(app, sources, tmp_path, empty_students):
+    broken = tmp_path / 'broken.json'
+    broken.write_text('[{"sid": "s99", "name": "cut off"')
+    with app.app_context():
+        with pytest.raises(ValueError):
+            stream_ingest(sources + [str(broken)], 2, 'stream-test')
+        assert loaded_students().empty
+    assert not os.listdir(os.path.join(app.config['STAGING_DIR'], 'stream-test'))
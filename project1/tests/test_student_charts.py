@@ -0,0 +1,70 @@
+from concurrent.futures import Future
+
+import pytest
+
+import app as app_module
+from app import save_students, student_chart_path, submit_student_charts
+from synthetic import students
+
+
+class RecordingPool:
+    """ Stands in for the chart process pool, handing out renders that never finish """
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, render, name, series, path):
+        self.submitted.append(name)
+        return Future()
+
+
+@pytest.fixture
+def charts(app, empty_students, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'CHART_DIR', str(tmp_path))
+    pool = RecordingPool()
+    monkeypatch.setattr(app_module, 'chart_pool', lambda broken=None: pool)
+    monkeypatch.setattr(app_module, '_chart_renders', {})
+    with app.app_context():
+        save_students(students(4, gpa=[8.0, 5.0, 9.0, 7.5], status=['pass', 'fail', 'pass', 'pass']))
+        yield pool
+
+
+def test_series_are_read_without_the_chart_lock(charts, monkeypatch):
+    read = app_module.student_chart_series
+    reads = []
+
+    def checked(scope, names):
+        assert not app_module._chart_lock.locked()
+        reads.append(names)
+        return read(scope, names)
+    monkeypatch.setattr(app_module, 'student_chart_series', checked)
+    pending = submit_student_charts('all', 1, ['gpa', 'status'])
+    assert sorted(pending) == ['gpa', 'status']
+    assert reads == [['gpa', 'status']]
+    # Renders in flight are shared, so asking again reads nothing
+    assert submit_student_charts('all', 1, ['gpa', 'status']) == pending
+    assert reads == [['gpa', 'status']]
+    assert sorted(charts.submitted) == ['gpa', 'status']
+
+
+def test_a_render_started_while_the_series_were_read_is_shared(charts, monkeypatch):
+    read = app_module.student_chart_series
+    started_elsewhere = Future()
+
+    def racing(scope, names):
+        # Another request submits the gpa chart meanwhile
+        app_module._chart_renders[student_chart_path('gpa', scope, 1)] = started_elsewhere
+        return read(scope, names)
+    monkeypatch.setattr(app_module, 'student_chart_series', racing)
+    pending = submit_student_charts('all', 1, ['gpa', 'scatter'])
+    assert pending['gpa'] is started_elsewhere
+    assert charts.submitted == ['scatter']
+
+
+def test_only_the_columns_of_the_requested_charts_are_read(charts, monkeypatch):
+    read = app_module.student_chart_rows
+    columns = []
+    monkeypatch.setattr(app_module, 'student_chart_rows', lambda scope, needed: columns.append(needed) or read(scope, needed))
+    series = app_module.student_chart_series('pass', ['scatter', 'gpa', 'status'])
+    assert columns == [['gpa', 'percentage', 'name']]
+    assert sorted(series) == ['gpa', 'scatter', 'status']
@@ -0,0 +1,57 @@
+import pytest
+
+from app import StudentSummary, check_student_summary, db, rebuild_student_summary, save_students
+from synthetic import students
+
+
+@pytest.fixture
+def empty_summary(app, empty_students):
+    with app.app_context():
+        db.session.execute(db.delete(StudentSummary))
+        db.session.commit()
+    yield
+    with app.app_context():
+        db.session.execute(db.delete(StudentSummary))
+        db.session.commit()
+
+
+def summary():
+    return {(row.status, row.gpa_bucket): (row.student_count, row.gpa_sum) for row in StudentSummary.query.all()}
+
+
+def test_loads_fold_their_batches_into_the_summary(app, empty_summary):
+    with app.app_context():
+        save_students(students(4, gpa=[8.0, 8.5, 4.0, 9.0], status=['pass', 'pass', 'fail', 'pass']))
+        assert summary() == {('pass', 8): (2, 16.5), ('pass', 9): (1, 9.0), ('fail', 4): (1, 4.0)}
+        assert check_student_summary().empty
+
+
+def test_upserts_move_rows_between_buckets(app, empty_summary):
+    with app.app_context():
+        save_students(students(3, gpa=[8.0, 8.5, 9.0]))
+        # s1 drops to a fail and s2 moves down a bucket
+        save_students(students(3, gpa=[8.0, 5.0, 8.25], status=['pass', 'fail', 'pass']), incremental=True)
+        assert summary() == {('pass', 8): (2, 16.25), ('fail', 5): (1, 5.0)}
+        assert check_student_summary().empty
+
+
+def test_deleting_a_student_takes_it_out_of_the_summary(app, client, empty_summary):
+    with app.app_context():
+        save_students(students(3, gpa=[8.0, 8.5, 4.0], status=['pass', 'pass', 'fail']))
+    assert client.get('/delete_student/s1').status_code == 302
+    assert client.get('/delete_student/s2').status_code == 302
+    with app.app_context():
+        # The emptied fail bucket is dropped
+        assert summary() == {('pass', 8): (1, 8.0)}
+        assert check_student_summary().empty
+
+
+def test_check_reports_buckets_that_drifted_and_rebuild_repairs_them(app, empty_summary):
+    with app.app_context():
+        save_students(students(3, gpa=[8.0, 8.5, 9.0]))
+        db.session.execute(db.update(StudentSummary).values(student_count=StudentSummary.student_count + 1))
+        db.session.commit()
+        assert sorted(check_student_summary().index) == [('pass', 8), ('pass', 9)]
+        assert rebuild_student_summary() == 2
+        assert check_student_summary().empty
+        assert summary() == {('pass', 8): (2, 16.5), ('pass', 9): (1, 9.0)}
@@ -0,0 +1,8 @@
+from app import read_source
+from synthetic import main, source_formats
+
+
+def test_the_generator_writes_the_rows_asked_for_in_every_source_format(tmp_path):
+    paths = main(['--rows', '50', '--dirty', '0.1', '--out', str(tmp_path)])
+    assert [path[path.rindex('.'):] for path in paths] == [extension for extension, _, _ in source_formats.values()]
+    assert sum(len(read_source(path)) for path in paths) == 50